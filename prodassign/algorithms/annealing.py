@@ -1,4 +1,5 @@
 import time
+from typing import Callable, Optional
 import wandb
 import numpy as np
 from tqdm import trange
@@ -18,7 +19,8 @@ class AnnealingSolution(RandomSolution):
         return normed_price + weight_energy * weight + volume_energy * volume
 
     def search(self, iterations=2, max_time=1e6, verbose=0, temperature=1, decay=1e-4,
-            weight_energy=0, volume_energy=0, use_wandb=False) -> Solution:
+            weight_energy=0, volume_energy=0, use_wandb=False,
+            on_improve:Optional[Callable[[Solution], None]]=None) -> Solution:
         sol = self.build(verbose=verbose, max_time=max_time)
         sol.optimize_capacities()
         e = self.energy(sol, weight_energy, volume_energy)
@@ -26,6 +28,8 @@ class AnnealingSolution(RandomSolution):
         best_e = self.energy(best, weight_energy, volume_energy)
         if verbose >= 1:
             print(Fore.YELLOW + f"\n\tInitial best: {best}")   
+        if on_improve is not None:
+            on_improve(best)
 
         pbar = trange(iterations, disable=verbose<1)
         pbar.bar_format = "{l_bar}%s{bar}%s{r_bar}" % (Fore.CYAN, Fore.RESET)
@@ -51,6 +55,8 @@ class AnnealingSolution(RandomSolution):
                     best_e = e
                     if verbose >= 1:
                         print(Fore.YELLOW + f"\n\tNew best: {best}")
+                    if on_improve is not None:
+                        on_improve(best)
 
                 if use_wandb:
                     wandb.log({'current_energy': e, 'best_energy': best_e,
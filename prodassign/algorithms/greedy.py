@@ -10,9 +10,9 @@ class GreedySolution(ProductAssignement):
     def build(self, verbose=1, max_time=10):
         products_per_capacities = {capa.item_id:[] for capa in self.capacities}
         order = np.argsort([product.weight for product in self.products])
-        self.products = np.take(self.products, order)
+        products = np.take(self.products, order)
         pallet = self.capacities[1]
-        for product in self.products:
+        for product in products:
             products_per_capacities[pallet.item_id].append(product.item_id)
         return Solution(products_per_capacities, problem=self)
 
@@ -20,7 +20,7 @@ class SolverSolution(ProductAssignement):
 
         # Create the mip solver with the SCIP backend.
         solver = pywraplp.Solver.CreateSolver('SCIP')
-        solver.SetTimeLimit(1000*max_time)
+        solver.SetTimeLimit(int(1000*max_time))
 
         # Variables
         # x[i, j] = 1 if item i is packed in bin j.
@@ -11,11 +11,11 @@ class PlacingSolution(ProductAssignement):
     def build(self, verbose=1, max_time=10):
         products_per_capacities = {capa.item_id:[] for capa in self.capacities}
         order = np.argsort([-product.weight for product in self.products])
-        self.products = np.take(self.products, order)
+        products = np.take(self.products, order)
 
         pallet = self.capacities[1]
         filled_pallets = [FilledCapacity(pallet, [], self)]
-        for product in tqdm(self.products, total=len(self.products), disable=verbose<1):
+        for product in tqdm(products, total=len(products), disable=verbose<1):
             filled_can_take = [filled_pallet.can_take(product) for filled_pallet in filled_pallets]
             product_id = product.item_id
             try:
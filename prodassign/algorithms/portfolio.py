@@ -0,0 +1,183 @@
+import copy
+import time
+import queue
+import multiprocessing as mp
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
+from colorama import Fore
+
+from prodassign.problem import ProductAssignement, Solution
+from prodassign.algorithms.random import RandomSolution
+from prodassign.algorithms.greedy import GreedySolution
+from prodassign.algorithms.placing import PlacingSolution
+from prodassign.algorithms.annealing import AnnealingSolution
+from prodassign.algorithms.orsolver import SolverSolution
+
+
+HEURISTIC_ALGORITHMS = {
+    'random': RandomSolution,
+    'greedy': GreedySolution,
+    'placing': PlacingSolution,
+    'annealing': AnnealingSolution,
+}
+SOLVER_ALGORITHMS = {
+    'solver-b&b': SolverSolution,
+}
+# The solver model has n² variables, above this it cannot even be built in time
+SOLVER_MAX_PRODUCTS = 200
+
+SOLUTION, DONE, ERROR = 'solution', 'done', 'error'
+
+
+def run_algorithm(name:str, alg_cls:Type[ProductAssignement], path:str, fraction:float,
+        deadline:float, results:'mp.Queue', search_kwargs:Optional[dict]=None):
+    """ Run one algorithm until deadline and put its assignments in the results queue.
+
+    Each strictly cheaper solution is sent as (name, SOLUTION, products_per_capacities), the parent
+    process rebuilds the Solution on its own problem so that nothing heavy has to be pickled.
+    The run always ends with a (name, DONE, None) or (name, ERROR, message) marker.
+    """
+    sent_price = float('inf')
+
+    def publish(sol:Solution):
+        nonlocal sent_price
+        if sol.price < sent_price:
+            sent_price = sol.price
+            results.put((name, SOLUTION, copy.deepcopy(sol.products_per_capacities)))
+
+    np.random.seed() # Forked workers would otherwise share the parent random state
+    try:
+        alg = alg_cls(path, fraction)
+        max_time = deadline - time.time() # Loading data is part of the budget
+        if max_time > 0:
+            if hasattr(alg, 'search'):
+                sol = alg.search(max_time=max_time, verbose=0, on_improve=publish,
+                    **(search_kwargs or {}))
+            else:
+                sol = alg.build(verbose=0, max_time=max_time)
+            sol.optimize_capacities()
+            publish(sol)
+        results.put((name, DONE, None))
+    except Exception as error: # Reported to the parent instead of dying silently
+        results.put((name, ERROR, repr(error)))
+
+
+class PortfolioSolution(ProductAssignement):
+    """ Run every algorithm concurrently under a shared deadline and keep the best solution.
+
+    Each algorithm runs in its own process so that it can be cancelled at any time,
+    including the OR-Tools model construction which holds the GIL.
+    """
+
+    def __init__(self, path:str, fraction:float=1):
+        super().__init__(path, fraction)
+        self.path = path
+        self.fraction = fraction
+
+    def default_algorithms(self) -> Dict[str, Type[ProductAssignement]]:
+        if len(self.products) > SOLVER_MAX_PRODUCTS:
+            return dict(HEURISTIC_ALGORITHMS)
+        return {**HEURISTIC_ALGORITHMS, **SOLVER_ALGORITHMS}
+
+    def price_lower_bound(self) -> float:
+        """ Cheapest possible price if capacities could be filled perfectly. """
+        total_weight = sum(product.weight for product in self.products)
+        total_volume = sum(product.volume for product in self.products)
+        weight_bound = total_weight * min(capa.price / capa.weight for capa in self.capacities)
+        volume_bound = total_volume * min(capa.price / capa.volume for capa in self.capacities)
+        return max(weight_bound, volume_bound)
+
+    def incumbents(self, max_time=10, lower_bound:Optional[float]=None,
+            algorithms:Optional[Dict[str, Type[ProductAssignement]]]=None,
+            annealing_iterations=int(1e9), grace_time=0.5, verbose=0) -> Iterator[Tuple[str, Solution]]:
+        """ Yield (algorithm_name, solution) each time a strictly cheaper valid solution is found.
+
+        Workers must stop grace_time before max_time so that their last results can still
+        be collected. Remaining workers are stopped once max_time is elapsed or once a
+        solution reaches lower_bound (defaults to price_lower_bound).
+        Raises a RuntimeError if every worker ended without a valid solution.
+        """
+        if algorithms is None:
+            algorithms = self.default_algorithms()
+        if lower_bound is None:
+            lower_bound = self.price_lower_bound()
+
+        t0 = time.time()
+        deadline = t0 + max_time
+        workers_deadline = deadline - min(grace_time, max_time / 2)
+
+        results = mp.Queue()
+        processes = []
+        for name, alg_cls in algorithms.items():
+            search_kwargs = {'iterations': annealing_iterations} \
+                if issubclass(alg_cls, AnnealingSolution) else None
+            args = (name, alg_cls, self.path, self.fraction, workers_deadline, results, search_kwargs)
+            process = mp.Process(target=run_algorithm, args=args, daemon=True)
+            process.start()
+            processes.append(process)
+
+        best_price = float('inf')
+        running = len(algorithms)
+        errors: List[str] = []
+        try:
+            while running > 0:
+                time_left = deadline - time.time()
+                if time_left <= 0:
+                    break
+                try:
+                    name, kind, content = results.get(timeout=time_left)
+                except queue.Empty:
+                    break
+
+                if kind == DONE:
+                    running -= 1
+                    continue
+                if kind == ERROR:
+                    running -= 1
+                    errors.append(f"{name}: {content}")
+                    if verbose >= 1:
+                        print(Fore.RED + f"\t{name} failed: {content}" + Fore.RESET)
+                    continue
+
+                sol = Solution(content, self)
+                if not sol.validate().valid: # An unsolved solver returns an empty assignment
+                    continue
+                if sol.price < best_price:
+                    best_price = sol.price
+                    yield name, sol
+                    if best_price <= lower_bound:
+                        break
+
+            if running == 0 and best_price == float('inf'):
+                raise RuntimeError(f"No algorithm found a valid solution, errors: {errors}")
+        finally:
+            for process in processes: # Results left in the queue would block a plain join
+                process.terminate()
+                process.join()
+
+    def search(self, max_time=10, verbose=0, lower_bound:Optional[float]=None,
+            callback:Optional[Callable[[str, Solution], None]]=None,
+            algorithms:Optional[Dict[str, Type[ProductAssignement]]]=None) -> Solution:
+        """ Consume incumbents until the deadline and return the best solution found. """
+        best = None
+        t0 = time.time()
+        for name, sol in self.incumbents(max_time, lower_bound, algorithms, verbose=verbose):
+            best = sol
+            if verbose >= 1:
+                print(Fore.YELLOW + f"\t{time.time() - t0:.2f}s New best from {name}: {sol}")
+            if callback is not None:
+                callback(name, sol)
+        if best is None:
+            raise TimeoutError(f"No valid solution was found within {max_time}s")
+        return best
+
+    def build(self, verbose=1, max_time=10):
+        return self.search(max_time=max_time, verbose=verbose)
+
+
+if __name__ == '__main__':
+    alg = PortfolioSolution('data', 0.1)
+    solution = alg.search(max_time=30, verbose=1)
+    print(solution, '\n', repr(solution))
+    print('Weights: ', solution.contents_weights())
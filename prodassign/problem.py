@@ -80,6 +80,36 @@ class ProductAssignement:
             for i, capacity_data in enumerate(load_transport_options(os.path.join(path, 'capacities')))
         ]
         self.products = self.products[:max(1, int(fraction * len(self.products)))]
+        # Indexed by item_id, used for vectorized checks
+        self.products_weights = np.array([product.weight for product in self.products], dtype=float)
+        self.products_volumes = np.array([product.volume for product in self.products], dtype=float)
+
+class ValidationReport:
+    """ Violations found by Solution.validate, the solution is valid if none is found. """
+
+    def __init__(self, missing_products:np.ndarray, duplicated_products:np.ndarray,
+            unknown_products:np.ndarray, overweight_bins:List[tuple], overvolume_bins:List[tuple]):
+        self.missing_products = missing_products
+        self.duplicated_products = duplicated_products
+        self.unknown_products = unknown_products
+        self.overweight_bins = overweight_bins # (capacity_id, bin_index, weight)
+        self.overvolume_bins = overvolume_bins # (capacity_id, bin_index, volume)
+
+    @property
+    def valid(self) -> bool:
+        return len(self.missing_products) == 0 and len(self.duplicated_products) == 0 \
+            and len(self.unknown_products) == 0 \
+            and len(self.overweight_bins) == 0 and len(self.overvolume_bins) == 0
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def __str__(self) -> str:
+        if self.valid:
+            return "Valid solution"
+        return f"Invalid solution | missing:{len(self.missing_products)} " + \
+            f"duplicated:{len(self.duplicated_products)} unknown:{len(self.unknown_products)} " + \
+            f"overweight:{len(self.overweight_bins)} overvolume:{len(self.overvolume_bins)}"
 
 class Solution:
 
@@ -211,22 +241,47 @@ class Solution:
 
         return capacities_products
 
+    def _assigned_products(self) -> np.ndarray:
+        return np.concatenate([
+            np.asarray(products, dtype=int)
+            for products in self.products_per_capacities.values()
+        ] + [np.empty(0, dtype=int)])
+
+    def validate(self) -> ValidationReport:
+        """ Check in linear time that every product is assigned exactly once within limits. """
+        n_products = len(self.problem.products)
+        product_ids = self._assigned_products()
+        known = (product_ids >= 0) & (product_ids < n_products)
+        counts = np.bincount(product_ids[known], minlength=n_products)
+        missing_products = np.flatnonzero(counts == 0)
+        duplicated_products = np.flatnonzero(counts > 1)
+        unknown_products = product_ids[~known]
+
+        overweight_bins, overvolume_bins = [], []
+        if len(unknown_products) == 0: # Bins cannot be filled with unknown products
+            for capacity_id, filled_capas in self.capacities_products.items():
+                if len(filled_capas) == 0:
+                    continue
+                capacity = self.problem.capacities[capacity_id]
+                contents = np.concatenate([
+                    np.asarray(filled_capa.content, dtype=int) for filled_capa in filled_capas])
+                bin_indexes = np.repeat(np.arange(len(filled_capas)),
+                    [len(filled_capa.content) for filled_capa in filled_capas])
+                bins_weights = np.bincount(bin_indexes,
+                    weights=self.problem.products_weights[contents], minlength=len(filled_capas))
+                bins_volumes = np.bincount(bin_indexes,
+                    weights=self.problem.products_volumes[contents], minlength=len(filled_capas))
+                overweight_bins += [(capacity_id, int(i), float(bins_weights[i]))
+                    for i in np.flatnonzero(bins_weights > capacity.weight)]
+                overvolume_bins += [(capacity_id, int(i), float(bins_volumes[i]))
+                    for i in np.flatnonzero(bins_volumes > capacity.volume)]
+
+        return ValidationReport(missing_products, duplicated_products, unknown_products,
+            overweight_bins, overvolume_bins)
+
     @property
-    def valid(self):
-        capa_valid = []
-        for _, filled_capas in self.capacities_products.items():
-            capa_valid.append(np.all(filled_capa.valid for filled_capa in filled_capas))
-
-        all_products_are_choosen = True
-        for product in self.problem.products:
-            in_any_capa = False
-            for _, products in self.products_per_capacities.items():
-                if product in products:
-                    in_any_capa = True
-            if not in_any_capa:
-                all_products_are_choosen = False
-
-        return np.all(capa_valid) and all_products_are_choosen
+    def valid(self) -> bool:
+        return self.validate().valid
 
     def contents_weights(self) -> Dict[Capacity, List[float]]:
         return {